@@ -0,0 +1,155 @@
+"""
+Long-lived pytest worker for the CYBERTEST GUI.
+
+pytest is imported once; the worker then reads one JSON request per line
+from stdin ({"args": [...]}), runs pytest.main(args) and lets pytest write
+its normal output to stdout. Each run ends with a result line: the marker
+passed as argv[1] followed by {"code": ..., "counts": {...}}.
+"""
+
+import json
+import os
+import site
+import sys
+import sysconfig
+import traceback
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pytest
+
+
+def _as_prefixes(paths: Iterable[str]) -> Tuple[str, ...]:
+    """Normalize folders into prefixes that only match whole path components."""
+    return tuple(
+        os.path.join(os.path.normcase(os.path.realpath(path)), "")
+        for path in paths
+    )
+
+
+# Installed code (stdlib, site-packages, user site) is never forgotten, even
+# when a virtualenv lives inside the project folder
+_INSTALLED_PATHS = _as_prefixes(
+    {
+        *(
+            sysconfig.get_paths()[key]
+            for key in ("stdlib", "platstdlib", "purelib", "platlib")
+        ),
+        *getattr(site, "getsitepackages", lambda: [])(),
+        site.getusersitepackages(),
+    }
+)
+
+
+class _ScopePlugin:
+    """pytest plugin that records where the code of this run lives."""
+
+    def __init__(self) -> None:
+        self.roots: List[str] = [os.getcwd()]
+
+    def pytest_configure(self, config: pytest.Config) -> None:
+        self.roots.append(str(config.rootpath))
+        for arg in config.args:
+            # Drop "::test_name" suffixes; files contribute their folder
+            path = os.path.abspath(arg.split("::")[0])
+            self.roots.append(path if os.path.isdir(path) else os.path.dirname(path))
+
+
+class _SummaryPlugin:
+    """pytest plugin that counts test outcomes as reports come in."""
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {
+            "passed": 0,
+            "failed": 0,
+            "errors": 0,
+            "skipped": 0,
+        }
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        # xfail/xpass are reported separately by pytest; ignore them here
+        if hasattr(report, "wasxfail"):
+            return
+        if report.passed:
+            if report.when == "call":
+                self.counts["passed"] += 1
+        elif report.failed:
+            if report.when == "call":
+                self.counts["failed"] += 1
+            else:
+                self.counts["errors"] += 1
+        elif report.skipped:
+            self.counts["skipped"] += 1
+
+    def pytest_collectreport(self, report: pytest.CollectReport) -> None:
+        if report.failed:
+            self.counts["errors"] += 1
+        elif report.skipped:
+            self.counts["skipped"] += 1
+
+
+def _forget_user_modules(before: Set[str], roots: Iterable[str]) -> None:
+    """
+    Drop modules imported since ``before`` that live under the run's roots.
+
+    pytest.main() imports test modules, conftest files and the code under
+    test into this process; forgetting them makes the next run pick up
+    edits. Everything else (pytest's own plugins, installed packages)
+    stays imported so later runs skip that import cost.
+    """
+    root_prefixes = _as_prefixes(roots)
+    for name in set(sys.modules) - before:
+        module_file = getattr(sys.modules[name], "__file__", None)
+        if not module_file:
+            continue
+        module_file = os.path.normcase(os.path.realpath(module_file))
+        if module_file.startswith(_INSTALLED_PATHS):
+            continue
+        if module_file.startswith(root_prefixes):
+            del sys.modules[name]
+
+
+def run_once(args: List[str]) -> Tuple[int, Optional[Dict[str, int]]]:
+    """
+    Run pytest.main() once and restore interpreter state afterwards.
+
+    Returns:
+        (exit_code, counts) -- counts is None if pytest crashed
+    """
+    summary = _SummaryPlugin()
+    scope = _ScopePlugin()
+    modules_before = set(sys.modules)
+    path_before = list(sys.path)
+    try:
+        exit_code = pytest.main(args, plugins=[summary, scope])
+    except Exception:  # noqa: BLE001
+        traceback.print_exc()
+        return 1, None
+    finally:
+        _forget_user_modules(modules_before, scope.roots)
+        sys.path[:] = path_before
+
+    return int(exit_code), summary.counts
+
+
+def main() -> None:
+    """Serve run requests from stdin until the GUI closes the pipe."""
+    marker = sys.argv[1]
+
+    # Mirror 'python -m pytest': the cwd, not this script's folder, comes first
+    sys.path[0] = os.getcwd()
+
+    while True:
+        request_line = sys.stdin.readline()
+        if not request_line:
+            break
+
+        exit_code, counts = run_once(json.loads(request_line)["args"])
+
+        sys.stdout.write(
+            marker + json.dumps({"code": exit_code, "counts": counts}) + "\n"
+        )
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
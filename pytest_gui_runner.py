@@ -1,13 +1,20 @@
+import html
+import json
 import os
+import queue
 import random
 import re
 import subprocess
 import sys
+import threading
 import tkinter as tk
+import zlib
 from datetime import datetime
+from itertools import islice
 from tkinter import filedialog, messagebox, scrolledtext
+import tkinter.font as tkfont
 import tkinter.ttk as ttk
-from typing import Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Literal, Optional, Tuple
 
 # === CYBERPUNK COLOR PALETTE ===
 BG_MAIN = "#050814"        # Deep near-black
@@ -19,37 +26,187 @@ NEON_PURPLE = "#9b5cff"
 NEON_ORANGE = "#ff8b3d"
 BORDER_NEON = "#3dffb8"
 
+# === BOOT ANIMATION ===
+BOOT_STEP_MS = 160         # Delay between boot ticks
+BOOT_LINES_PER_TICK = 2    # Boot lines printed per tick
+
+# === TERMINAL FEED STREAMING ===
+DRAIN_INTERVAL_MS = 30     # How often queued pytest lines are flushed to the feed
+DRAIN_MAX_LINES = 500      # Max lines inserted into the feed per flush
+FEED_MAX_LINES = 5000      # Oldest feed lines are dropped beyond this
+
+# === TEST SUMMARY PARSING ===
+SUMMARY_RE = re.compile(r"(\d+)\s+(passed|failed|errors?|skipped)\b")
+SUMMARY_KEYWORDS = (" passed", " failed", " skipped", " error")
+SUMMARY_TAIL_LINES = 80    # Output lines searched for the summary, from the end
+SUMMARY_BUCKETS = {        # pytest wording -> summary counter
+    "passed": "passed",
+    "failed": "failed",
+    "error": "errors",
+    "errors": "errors",
+    "skipped": "skipped",
+}
+
+# === HTML EXPORT ===
+HTML_HEADER = (
+    "<!DOCTYPE html>\n"
+    "<html>\n<head>\n"
+    "<meta charset='utf-8'>\n"
+    "<title>pytest output</title>\n"
+    "<style>\n"
+    "body { background:#050814; color:#f5f5f5; "
+    "font-family:Consolas,monospace; }\n"
+    "h2 { color:#00f5ff; }\n"
+    "pre { background:#0b1020; padding:1rem; border:1px solid #3dffb8; "
+    "color:#e0e0ff; white-space:pre-wrap; }\n"
+    "</style>\n"
+    "</head>\n<body>\n"
+    "<h2>CYBERTEST // pytest output</h2>\n"
+    "<pre>\n"
+)
+HTML_FOOTER = (
+    "\n"
+    "</pre>\n"
+    "</body>\n</html>\n"
+)
+
+# === PYTEST FLAGS ===
+FLAG_ARGS: Dict[str, List[str]] = {   # Combobox choice -> pytest args
+    "Normal": [],
+    "-q": ["-q"],
+    "-vv": ["-vv"],
+    "-x": ["-x"],
+}
+
+# === PYTEST WORKER ===
+WORKER_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "_pytest_worker.py",
+)
+WORKER_RESULT_MARKER = "@@CYBERTEST-RESULT@@"
+WORKER_MAX_RUNS = 20       # Restart the worker so state leaked by tests can't pile up
+
+# (stdout, stderr, return_code, counts) -- counts is None if pytest never ran
+PytestResult = Tuple[str, str, int, Optional[Dict[str, int]]]
+
+
+class PytestWorker:
+    """A long-lived Python process that imports pytest once and runs it on demand."""
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+        self._runs: int = 0
+
+    def start(self) -> None:
+        """Spawn the worker process."""
+        self._proc = subprocess.Popen(
+            [sys.executable, "-u", WORKER_SCRIPT, WORKER_RESULT_MARKER],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1,
+            shell=False,
+        )
+        self._runs = 0
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not go quietly."""
+        proc = self._proc
+        self._proc = None
+        if proc is None:
+            return
+
+        try:
+            if proc.poll() is None:
+                try:
+                    assert proc.stdin is not None
+                    proc.stdin.close()
+                    proc.wait(timeout=1)
+                except (OSError, subprocess.TimeoutExpired):
+                    proc.kill()
+                    proc.wait()
+        finally:
+            # Close our pipe ends so restarts don't leak file descriptors
+            for pipe in (proc.stdin, proc.stdout):
+                if pipe is not None:
+                    try:
+                        pipe.close()
+                    except OSError:
+                        pass
+
+    def run(
+        self,
+        args: List[str],
+        on_line: Optional[Callable[[str], None]] = None,
+    ) -> PytestResult:
+        """
+        Run pytest.main(args) in the worker, streaming its output.
+
+        Returns:
+            (stdout, stderr, return_code, counts)
+        """
+        if self._proc is None or self._proc.poll() is not None:
+            self.stop()
+            self.start()
+
+        proc = self._proc
+        assert proc is not None and proc.stdin is not None and proc.stdout is not None
+
+        try:
+            proc.stdin.write(json.dumps({"args": args}) + "\n")
+            proc.stdin.flush()
+        except OSError:
+            self.stop()
+            raise
+
+        self._runs += 1
+        lines: list[str] = []
+        for line in iter(proc.stdout.readline, ""):
+            output, marker, payload = line.partition(WORKER_RESULT_MARKER)
+            if output:
+                lines.append(output)
+                if on_line is not None:
+                    on_line(output)
+            if marker:
+                result = json.loads(payload)
+                if self._runs >= WORKER_MAX_RUNS:
+                    self.stop()
+                    self.start()
+                return "".join(lines), "", int(result["code"]), result["counts"]
+
+        # EOF before the result line: the worker died mid-run
+        self.stop()
+        return "".join(lines), "pytest worker exited unexpectedly", 1, None
+
 
 def run_pytest(
+    worker: PytestWorker,
     target_path: str,
     is_directory: bool,
     flag: Optional[str] = None,
-) -> Tuple[str, str, int]:
+    on_line: Optional[Callable[[str], None]] = None,
+) -> PytestResult:
     """
-    Run 'python -m pytest' on the given file or directory.
+    Run pytest on the given file or directory in the persistent worker.
+
+    stderr is merged into stdout and every line is handed to ``on_line``
+    as soon as pytest writes it, so callers can stream the output.
 
     Returns:
-        (stdout, stderr, return_code)
+        (stdout, stderr, return_code, counts)
     """
     try:
-        cmd = [sys.executable, "-m", "pytest"]
-
-        if flag and flag.lower() != "normal":
-            cmd.append(flag)
-
-        cmd.append(target_path)
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            shell=False,
-        )
+        # The GUI never reads .pytest_cache, so skip its per-run disk I/O
+        args = ["-p", "no:cacheprovider"]
+        args.extend(FLAG_ARGS.get(flag or "Normal", []))
+        args.append(target_path)
 
-        return result.stdout, result.stderr, result.returncode
+        return worker.run(args, on_line=on_line)
 
     except Exception as exc:  # noqa: BLE001
-        return "", f"Unexpected error running pytest: {exc}", 1
+        return "", f"Unexpected error running pytest: {exc}", 1, None
 
 
 class PytestGUI(tk.Tk):
@@ -70,6 +227,24 @@ class PytestGUI(tk.Tk):
         self.last_stdout: str = ""
         self.last_stderr: str = ""
         self.boot_in_progress: bool = True
+        # History entry whose output is on screen; exports decompress its full
+        # text because the feed itself may be trimmed
+        self._feed_entry: Optional[dict] = None
+
+        # Pytest run state (pytest runs on a worker thread)
+        self.run_in_progress: bool = False
+        self._run_target: Tuple[str, bool] = ("", False)  # (path, is_directory)
+        self._output_queue: "queue.Queue[str]" = queue.Queue()
+        self._pytest_result: Optional[PytestResult] = None
+        self._pending_flag: str = ""
+        self._run_header: str = ""
+        self._drain_job: Optional[str] = None
+
+        # Spawn the pytest worker now so its startup overlaps target selection
+        self._worker = PytestWorker()
+        self._worker.start()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.bind("<<PytestDone>>", self._on_pytest_done)
 
         # Animation state
         self.scan_x: int = 0
@@ -86,8 +261,13 @@ class PytestGUI(tk.Tk):
         self.cpu_usage: int = 0
         self.ram_used_gb: float = 0.0
         self.ram_total_gb: float = 16.0
+        self._rng = random.Random()  # HUD-only RNG, independent of the module one
+        self._last_cpu: Optional[int] = None
+        self._last_ram: Optional[float] = None
+        # HUD bar per canvas: (item id, fill color, cached (width, height))
+        self._bars: Dict[tk.Canvas, Tuple[int, str, Optional[Tuple[int, int]]]] = {}
 
-        # Last runs history: list of dicts containing summary + full output
+        # Last runs history: list of dicts containing summary + compressed output
         self.run_history: list[dict] = []
 
         # Configure ttk style for neon look
@@ -105,8 +285,23 @@ class PytestGUI(tk.Tk):
         self.after(500, self._blink_cursor)
         self.after(800, self._update_hud)
 
+    def _on_close(self) -> None:
+        """Shut down the pytest worker along with the window."""
+        self._worker.stop()
+        self.destroy()
+
     def _configure_style(self) -> None:
-        """Configure ttk styles to match neon theme."""
+        """Configure shared fonts and ttk styles to match neon theme."""
+        # Shared font objects: Tk resolves and measures each one only once
+        self._font_title = tkfont.Font(family="Consolas", size=18, weight="bold")
+        self._font_text = tkfont.Font(family="Consolas", size=10)
+        self._font_bold = tkfont.Font(family="Consolas", size=10, weight="bold")
+        self._font_small = tkfont.Font(family="Consolas", size=9)
+        self._font_small_bold = tkfont.Font(family="Consolas", size=9, weight="bold")
+        self._font_tiny = tkfont.Font(family="Consolas", size=8)
+        self._font_button = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+        self._font_ui = tkfont.Font(family="Segoe UI", size=9)
+
         style = ttk.Style(self)
         style.theme_use("clam")
 
@@ -151,7 +346,7 @@ class PytestGUI(tk.Tk):
             padx=12,
             pady=6,
             highlightthickness=0,
-            font=("Segoe UI", 10, "bold"),
+            font=self._font_button,
         )
 
     def _create_widgets(self) -> None:
@@ -166,7 +361,7 @@ class PytestGUI(tk.Tk):
             text="CYBERTEST // PYTEST RUNNER",
             fg=NEON_CYAN,
             bg=BG_MAIN,
-            font=("Consolas", 18, "bold"),
+            font=self._font_title,
         )
         title_label.pack(side=tk.LEFT, padx=(5, 20))
 
@@ -175,7 +370,7 @@ class PytestGUI(tk.Tk):
             text="INIT: diagnostics_online  •  by Lance Jepsen",
             fg=NEON_PURPLE,
             bg=BG_MAIN,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         subtitle_label.pack(side=tk.LEFT, pady=4)
 
@@ -194,13 +389,13 @@ class PytestGUI(tk.Tk):
             bd=2,
             relief=tk.GROOVE,
             labelanchor="nw",
-            font=("Consolas", 9, "bold"),
+            font=self._font_small_bold,
         )
         mode_frame.pack(fill=tk.X, pady=5)
 
         self.mode_var = tk.StringVar(value="file")
 
-        file_radio = tk.Radiobutton(
+        self.file_radio = tk.Radiobutton(
             mode_frame,
             text="Single file",
             variable=self.mode_var,
@@ -211,9 +406,9 @@ class PytestGUI(tk.Tk):
             selectcolor=BG_MAIN,
             activebackground=BG_PANEL,
             activeforeground=NEON_CYAN,
-            font=("Segoe UI", 9),
+            font=self._font_ui,
         )
-        folder_radio = tk.Radiobutton(
+        self.folder_radio = tk.Radiobutton(
             mode_frame,
             text="Folder (auto-detect tests: test_*.py)",
             variable=self.mode_var,
@@ -224,10 +419,10 @@ class PytestGUI(tk.Tk):
             selectcolor=BG_MAIN,
             activebackground=BG_PANEL,
             activeforeground=NEON_CYAN,
-            font=("Segoe UI", 9),
+            font=self._font_ui,
         )
-        file_radio.pack(side=tk.LEFT, padx=10, pady=6)
-        folder_radio.pack(side=tk.LEFT, padx=10, pady=6)
+        self.file_radio.pack(side=tk.LEFT, padx=10, pady=6)
+        self.folder_radio.pack(side=tk.LEFT, padx=10, pady=6)
 
         # === CONTROL BAR (SELECT / RUN / FLAGS) ===
         control_outer = tk.Frame(self, bg=BG_MAIN)
@@ -261,7 +456,7 @@ class PytestGUI(tk.Tk):
             text="pytest flags:",
             fg=NEON_CYAN,
             bg=BG_PANEL,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         flag_label.pack(side=tk.LEFT, padx=(24, 5))
 
@@ -273,7 +468,7 @@ class PytestGUI(tk.Tk):
             width=10,
             style="Neon.TCombobox",
         )
-        self.flag_combo["values"] = ("Normal", "-q", "-vv", "-x")
+        self.flag_combo["values"] = tuple(FLAG_ARGS)
         self.flag_combo.current(0)
         self.flag_combo.pack(side=tk.LEFT, padx=6, pady=6)
 
@@ -284,7 +479,7 @@ class PytestGUI(tk.Tk):
             fg="#8888aa",
             bg=BG_MAIN,
             anchor="w",
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         self.path_label.pack(fill=tk.X, padx=14, pady=(4, 4))
 
@@ -313,6 +508,15 @@ class PytestGUI(tk.Tk):
             bd=0,
         )
         self.scan_canvas.pack(fill=tk.X, padx=4, pady=(4, 0))
+        self.scan_canvas.create_rectangle(
+            0,
+            0,
+            80,
+            6,
+            fill="#1b2238",
+            outline="",
+            tags="scanline",
+        )
 
         output_label = tk.Label(
             output_frame,
@@ -320,7 +524,7 @@ class PytestGUI(tk.Tk):
             fg=NEON_PINK,
             bg=BG_PANEL,
             anchor="w",
-            font=("Consolas", 9, "bold"),
+            font=self._font_small_bold,
         )
         output_label.pack(fill=tk.X, padx=6, pady=(2, 0))
 
@@ -332,7 +536,7 @@ class PytestGUI(tk.Tk):
             insertbackground=NEON_CYAN,
             relief=tk.FLAT,
             bd=0,
-            font=("Consolas", 10),
+            font=self._font_text,
         )
         self.output_text.pack(fill=tk.BOTH, expand=True, padx=6, pady=6)
 
@@ -354,7 +558,7 @@ class PytestGUI(tk.Tk):
             text="SYSTEM HUD",
             fg=NEON_CYAN,
             bg=BG_PANEL,
-            font=("Consolas", 10, "bold"),
+            font=self._font_bold,
         )
         hud_title.pack(anchor="w", padx=8, pady=(6, 2))
 
@@ -363,7 +567,7 @@ class PytestGUI(tk.Tk):
             text="CPU: -- %",
             fg=FG_TEXT,
             bg=BG_PANEL,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         self.cpu_label.pack(anchor="w", padx=12, pady=2)
 
@@ -372,7 +576,7 @@ class PytestGUI(tk.Tk):
             text="RAM: -- / -- GB",
             fg=FG_TEXT,
             bg=BG_PANEL,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         self.ram_label.pack(anchor="w", padx=12, pady=(0, 8))
 
@@ -410,7 +614,7 @@ class PytestGUI(tk.Tk):
             text="TEST SUMMARY",
             fg=NEON_ORANGE,
             bg=BG_PANEL,
-            font=("Consolas", 10, "bold"),
+            font=self._font_bold,
         )
         summary_title.pack(anchor="w", padx=8, pady=(6, 2))
 
@@ -419,7 +623,7 @@ class PytestGUI(tk.Tk):
             text="Total: 0",
             fg=FG_TEXT,
             bg=BG_PANEL,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         self.summary_total.pack(anchor="w", padx=12, pady=2)
 
@@ -428,7 +632,7 @@ class PytestGUI(tk.Tk):
             text="Passed: 0",
             fg="#3dffb8",
             bg=BG_PANEL,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         self.summary_passed.pack(anchor="w", padx=12, pady=2)
 
@@ -437,7 +641,7 @@ class PytestGUI(tk.Tk):
             text="Failed: 0",
             fg="#ff5555",
             bg=BG_PANEL,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         self.summary_failed.pack(anchor="w", padx=12, pady=2)
 
@@ -446,7 +650,7 @@ class PytestGUI(tk.Tk):
             text="Errors: 0",
             fg="#ff8b3d",
             bg=BG_PANEL,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         self.summary_errors.pack(anchor="w", padx=12, pady=2)
 
@@ -455,7 +659,7 @@ class PytestGUI(tk.Tk):
             text="Skipped: 0",
             fg="#cccc88",
             bg=BG_PANEL,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         self.summary_skipped.pack(anchor="w", padx=12, pady=2)
 
@@ -464,7 +668,7 @@ class PytestGUI(tk.Tk):
             text="// last run only",
             fg="#8888aa",
             bg=BG_PANEL,
-            font=("Consolas", 8),
+            font=self._font_tiny,
         )
         summary_hint.pack(anchor="w", padx=12, pady=(4, 4))
 
@@ -474,7 +678,7 @@ class PytestGUI(tk.Tk):
             text="LAST 5 RUNS",
             fg=NEON_PINK,
             bg=BG_PANEL,
-            font=("Consolas", 10, "bold"),
+            font=self._font_bold,
         )
         history_title.pack(anchor="w", padx=8, pady=(4, 2))
 
@@ -485,7 +689,7 @@ class PytestGUI(tk.Tk):
             fg="#d0d0ff",
             bd=0,
             highlightthickness=0,
-            font=("Consolas", 8),
+            font=self._font_tiny,
             selectbackground="#1b2238",
             selectforeground="#ffffff",
         )
@@ -506,26 +710,26 @@ class PytestGUI(tk.Tk):
         )
         export_frame.pack(fill=tk.X)
 
-        save_txt_button = self._neon_button(
+        self.save_txt_button = self._neon_button(
             export_frame,
             text="EXPORT TXT",
             command=self.save_output_txt,
         )
-        save_txt_button.pack(side=tk.LEFT, padx=8, pady=6)
+        self.save_txt_button.pack(side=tk.LEFT, padx=8, pady=6)
 
-        save_html_button = self._neon_button(
+        self.save_html_button = self._neon_button(
             export_frame,
             text="EXPORT HTML",
             command=self.save_output_html,
         )
-        save_html_button.pack(side=tk.LEFT, padx=8, pady=6)
+        self.save_html_button.pack(side=tk.LEFT, padx=8, pady=6)
 
         self.cursor_label = tk.Label(
             export_frame,
             text="> BOOTING _",
             fg="#9999cc",
             bg=BG_PANEL,
-            font=("Consolas", 9),
+            font=self._font_small,
         )
         self.cursor_label.pack(side=tk.RIGHT, padx=10, pady=4)
 
@@ -534,8 +738,9 @@ class PytestGUI(tk.Tk):
     def _start_boot_sequence(self) -> None:
         """Kick off fake console boot animation."""
         self.output_text.delete("1.0", tk.END)
+        self._feed_entry = None
 
-        self._boot_lines = [
+        self._boot_iter: Iterator[str] = iter([
             "[CYBERTEST v1.0.0] initializing diagnostic core...",
             "[OK]   loading neon theme shaders",
             "[OK]   linking pytest runtime module",
@@ -545,16 +750,19 @@ class PytestGUI(tk.Tk):
             "",
             "[HINT] select a file or folder to begin test run.",
             "",
-        ]
-        self._boot_step(0)
-
-    def _boot_step(self, index: int) -> None:
-        """Print boot lines one by one with delay."""
-        if index < len(self._boot_lines):
-            line = self._boot_lines[index]
-            self.output_text.insert(tk.END, line + "\n")
+        ])
+        self._boot_step()
+
+    def _boot_step(self) -> None:
+        """Print the next few boot lines, then schedule the rest."""
+        chunk = list(islice(self._boot_iter, BOOT_LINES_PER_TICK))
+        if chunk:
+            self.output_text.insert(tk.END, "".join(line + "\n" for line in chunk))
+            self._trim_output()
             self.output_text.see(tk.END)
-            self.after(160, self._boot_step, index + 1)
+
+        if len(chunk) == BOOT_LINES_PER_TICK:
+            self.after(BOOT_STEP_MS, self._boot_step)
         else:
             self.boot_in_progress = False
             self.select_button.config(state=tk.NORMAL, bg=NEON_PINK)
@@ -562,34 +770,36 @@ class PytestGUI(tk.Tk):
 
     def _animate_scanline(self) -> None:
         """Animate a small scanline bar moving across the top of the output."""
+        # Nobody can see the animation while the window is minimized
+        if not self.winfo_viewable():
+            self.after(50, self._animate_scanline)
+            return
+
         width = self.scan_canvas.winfo_width()
         height = self.scan_canvas.winfo_height()
 
-        self.scan_canvas.delete("scanline")
-
         if width > 0 and height > 0:
-            x1 = self.scan_x
-            x2 = self.scan_x + 80
-            if x2 > width:
-                x2 = width
-            self.scan_canvas.create_rectangle(
-                x1,
-                0,
-                x2,
-                height,
-                fill="#1b2238",
-                outline="",
-                tags="scanline",
-            )
-
-            self.scan_x += 12
             if self.scan_x > width:
                 self.scan_x = -80
+                self.scan_canvas.coords(
+                    "scanline",
+                    self.scan_x,
+                    0,
+                    self.scan_x + 80,
+                    height,
+                )
+            else:
+                self.scan_canvas.move("scanline", 12, 0)
+                self.scan_x += 12
 
         self.after(50, self._animate_scanline)
 
     def _blink_cursor(self) -> None:
         """Toggle blinking cursor in status label."""
+        if not self.winfo_viewable():
+            self.after(500, self._blink_cursor)
+            return
+
         text = self.cursor_label.cget("text")
         if self.cursor_on:
             if text.endswith("_"):
@@ -603,38 +813,65 @@ class PytestGUI(tk.Tk):
 
     def _update_hud(self) -> None:
         """Fake CPU/RAM HUD updates."""
-        delta = random.randint(-10, 10)
-        base = self.cpu_usage or random.randint(15, 40)
+        if not self.winfo_viewable():
+            self.after(900, self._update_hud)
+            return
+
+        delta = self._rng.randint(-10, 10)
+        base = self.cpu_usage or self._rng.randint(15, 40)
         self.cpu_usage = max(5, min(98, base + delta))
 
-        self.ram_used_gb = round(random.uniform(3.0, 14.0), 1)
+        self.ram_used_gb = round(self._rng.uniform(3.0, 14.0), 1)
 
-        self.cpu_label.config(text=f"CPU: {self.cpu_usage:2d} %")
-        self.ram_label.config(
-            text=f"RAM: {self.ram_used_gb:4.1f} / {self.ram_total_gb:.0f} GB",
-        )
+        # Skip label re-layout and bar redraws when nothing visible changed
+        if self.cpu_usage != self._last_cpu:
+            self.cpu_label.config(text=f"CPU: {self.cpu_usage:2d} %")
+            self._draw_bar(self.cpu_bar, self.cpu_usage / 100.0, NEON_CYAN)
+            self._last_cpu = self.cpu_usage
 
-        self._draw_bar(self.cpu_bar, self.cpu_usage / 100.0, NEON_CYAN)
-        self._draw_bar(self.ram_bar, self.ram_used_gb / self.ram_total_gb, NEON_PINK)
+        if self.ram_used_gb != self._last_ram:
+            self.ram_label.config(
+                text=f"RAM: {self.ram_used_gb:4.1f} / {self.ram_total_gb:.0f} GB",
+            )
+            self._draw_bar(
+                self.ram_bar,
+                self.ram_used_gb / self.ram_total_gb,
+                NEON_PINK,
+            )
+            self._last_ram = self.ram_used_gb
 
         self.after(900, self._update_hud)
 
-    @staticmethod
-    def _draw_bar(canvas: tk.Canvas, fill_ratio: float, color: str) -> None:
-        """Draw a simple filled bar on the given canvas."""
-        canvas.delete("bar")
-        width = canvas.winfo_width() or 160
-        height = canvas.winfo_height() or 10
+    def _draw_bar(self, canvas: tk.Canvas, fill_ratio: float, color: str) -> None:
+        """Draw a simple filled bar on the given canvas, reusing its bar item."""
+        bar = self._bars.get(canvas)
+        size = bar[2] if bar is not None else None
+        if size is None:
+            width = canvas.winfo_width()
+            height = canvas.winfo_height()
+            # winfo_* report 1 until the canvas is mapped; cache real sizes only
+            if width > 1 and height > 1:
+                size = (width, height)
+        width, height = size or (160, 10)
         fill_width = int(width * max(0.0, min(1.0, fill_ratio)))
-        canvas.create_rectangle(
-            0,
-            0,
-            fill_width,
-            height,
-            fill=color,
-            outline="",
-            tags="bar",
-        )
+
+        if bar is None:
+            item = canvas.create_rectangle(
+                0,
+                0,
+                fill_width,
+                height,
+                fill=color,
+                outline="",
+                tags="bar",
+            )
+        else:
+            item, last_color, _ = bar
+            canvas.coords(item, 0, 0, fill_width, height)
+            if last_color != color:
+                canvas.itemconfig(item, fill=color)
+
+        self._bars[canvas] = (item, color, size)
 
     # === TEST SUMMARY & HISTORY ===
 
@@ -642,38 +879,38 @@ class PytestGUI(tk.Tk):
         """
         Parse pytest output for summary counts and update HUD labels.
 
-        Looks for patterns like:
-        "3 passed, 1 failed, 2 skipped in 0.12s"
+        Only the last summary line counts, e.g.:
+        "==== 3 passed, 1 failed, 2 skipped in 0.12s ===="
         """
-        passed = failed = errors = skipped = 0
-
-        pattern_map = {
-            "passed": "passed",
-            "failed": "failed",
-            "error": "errors",
-            "errors": "errors",
-            "skipped": "skipped",
-        }
-
-        for line in text.splitlines():
-            if (
-                " passed" in line
-                or " failed" in line
-                or " skipped" in line
-                or " error" in line
-            ):
-                for key, label in pattern_map.items():
-                    for match in re.finditer(rf"(\d+)\s+{key}", line):
-                        value = int(match.group(1))
-                        if label == "passed":
-                            passed += value
-                        elif label == "failed":
-                            failed += value
-                        elif label == "errors":
-                            errors += value
-                        elif label == "skipped":
-                            skipped += value
-
+        counts = dict.fromkeys(("passed", "failed", "errors", "skipped"), 0)
+
+        # The summary is the last line pytest prints; only split off the tail
+        tail_start = len(text)
+        for _ in range(SUMMARY_TAIL_LINES):
+            tail_start = text.rfind("\n", 0, tail_start)
+            if tail_start < 0:
+                break
+
+        for line in reversed(text[tail_start + 1:].splitlines()):
+            if " in " not in line:
+                continue
+            if not any(keyword in line for keyword in SUMMARY_KEYWORDS):
+                continue
+            matches = SUMMARY_RE.findall(line)
+            if not matches:
+                continue
+            for value, key in matches:
+                counts[SUMMARY_BUCKETS[key]] = int(value)
+            break
+
+        self._apply_test_counts(counts)
+
+    def _apply_test_counts(self, counts: Dict[str, int]) -> None:
+        """Store summary counts and update HUD labels."""
+        passed = counts["passed"]
+        failed = counts["failed"]
+        errors = counts["errors"]
+        skipped = counts["skipped"]
         total = passed + failed + errors + skipped
 
         self.tests_passed = passed
@@ -688,15 +925,22 @@ class PytestGUI(tk.Tk):
         self.summary_errors.config(text=f"Errors: {errors}")
         self.summary_skipped.config(text=f"Skipped: {skipped}")
 
-    def _add_run_to_history(self, exit_code: int, flag: str, output: str) -> None:
+    def _add_run_to_history(
+        self,
+        exit_code: int,
+        flag: str,
+        output: str,
+        target_path: str,
+        is_directory: bool,
+    ) -> dict:
         """Record this run in the last 5 runs history with full output."""
         timestamp = datetime.now().strftime("%H:%M:%S")
         status = "OK"
         if exit_code != 0 or self.tests_failed > 0 or self.tests_errors > 0:
             status = "ISSUE"
 
-        target_type = "FOLDER" if self.is_directory else "FILE"
-        name = self.selected_path or "?"
+        target_type = "FOLDER" if is_directory else "FILE"
+        name = target_path or "?"
         name = os.path.basename(name) or name
 
         summary = (
@@ -708,7 +952,8 @@ class PytestGUI(tk.Tk):
 
         entry = {
             "summary": summary,
-            "output": output,
+            # pytest output compresses well; level 1 keeps this fast
+            "output_zbytes": zlib.compress(output.encode("utf-8"), 1),
             "exit_code": exit_code,
             "flag": flag,
             "timestamp": timestamp,
@@ -726,13 +971,18 @@ class PytestGUI(tk.Tk):
         self.run_history.append(entry)
         self.run_history = self.run_history[-5:]  # keep last 5
 
-        # Show newest at top
-        self.history_listbox.delete(0, tk.END)
-        for item in reversed(self.run_history):
-            self.history_listbox.insert(tk.END, item["summary"])
+        # Show newest at top; drop whatever scrolled past the last 5
+        self.history_listbox.insert(0, summary)
+        if self.history_listbox.size() > 5:
+            self.history_listbox.delete(5, tk.END)
+
+        return entry
 
     def _on_history_select(self, event: tk.Event) -> None:  # type: ignore[type-arg]
         """When user clicks an item in last 5 runs, show that output in the terminal."""
+        if self.run_in_progress:
+            return
+
         selection = self.history_listbox.curselection()
         if not selection:
             return
@@ -747,20 +997,26 @@ class PytestGUI(tk.Tk):
             return
 
         entry = self.run_history[history_index]
-        output = entry.get("output", "")
-
-        if not output:
+        zbytes = entry.get("output_zbytes")
+        if not zbytes:
             return
 
+        output = zlib.decompress(zbytes).decode("utf-8")
+
         self.output_text.delete("1.0", tk.END)
         self.output_text.insert(tk.END, output)
+        self._trim_output()
         self.output_text.see(tk.END)
+        self._feed_entry = entry
         self.cursor_label.config(text="> HISTORY VIEW _")
 
     # === CORE LOGIC ===
 
     def _on_mode_change(self) -> None:
         """Update UI elements when mode changes."""
+        if self.run_in_progress:
+            return
+
         mode = self.mode_var.get()
         if mode == "file":
             self.select_button.config(text="SELECT FILE")
@@ -772,6 +1028,7 @@ class PytestGUI(tk.Tk):
         self.path_label.config(text="// no target selected")
         self.run_button.config(state=tk.DISABLED, bg="#555555")
         self.output_text.delete("1.0", tk.END)
+        self._feed_entry = None
 
     def select_path(self) -> None:
         """Open file or folder picker based on current mode."""
@@ -800,6 +1057,7 @@ class PytestGUI(tk.Tk):
         self.run_button.config(state=tk.NORMAL, bg=NEON_PINK)
 
         self.output_text.delete("1.0", tk.END)
+        self._feed_entry = None
         self.output_text.insert(
             tk.END,
             "[READY] target locked. execute RUN PYTEST to begin.\n\n",
@@ -807,7 +1065,7 @@ class PytestGUI(tk.Tk):
         self.output_text.see(tk.END)
 
     def run_tests(self) -> None:
-        """Run pytest on the selected path and display the output."""
+        """Start pytest on the selected path and stream its output."""
         if not self.selected_path:
             messagebox.showwarning(
                 "No target",
@@ -815,58 +1073,161 @@ class PytestGUI(tk.Tk):
             )
             return
 
+        if self.run_in_progress:
+            return
+
         flag = self.flag_var.get()
 
         self.output_text.delete("1.0", tk.END)
+        self._feed_entry = None
         target_type = "FOLDER" if self.is_directory else "FILE"
-        self.output_text.insert(
-            tk.END,
-            f"[BOOT] pytest engaged on {target_type}:\n{self.selected_path}\n",
+        parts = [f"[BOOT] pytest engaged on {target_type}:\n{self.selected_path}\n"]
+        if FLAG_ARGS.get(flag):
+            parts.append(f"[FLAG] {flag}\n")
+        parts.append("\n")
+        parts.append("=== PYTEST OUTPUT ===\n")
+        self._run_header = "".join(parts)
+        self.output_text.insert(tk.END, self._run_header)
+
+        self.run_in_progress = True
+        self._run_target = (self.selected_path, self.is_directory)
+        self._pending_flag = flag
+        self._pytest_result = None
+        self._set_run_controls(enabled=False)
+        self.cursor_label.config(text="> RUNNING _")
+
+        worker = threading.Thread(
+            target=self._run_pytest_worker,
+            args=(self.selected_path, self.is_directory, flag),
+            daemon=True,
         )
-        if flag and flag.lower() != "normal":
-            self.output_text.insert(tk.END, f"[FLAG] {flag}\n")
-        self.output_text.insert(tk.END, "\n")
-        self.output_text.update_idletasks()
+        worker.start()
+        self._drain_job = self.after(DRAIN_INTERVAL_MS, self._drain_queue)
 
-        stdout, stderr, return_code = run_pytest(
-            self.selected_path,
-            self.is_directory,
+    def _run_pytest_worker(
+        self,
+        target_path: str,
+        is_directory: bool,
+        flag: str,
+    ) -> None:
+        """Run pytest off the Tk thread; lines are queued for the main loop."""
+        self._pytest_result = run_pytest(
+            self._worker,
+            target_path,
+            is_directory,
             flag=flag,
+            on_line=self._output_queue.put,
         )
+        # Hand completion back to the Tk thread
+        try:
+            self.event_generate("<<PytestDone>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass  # window closed while pytest was running
+
+    def _drain_queue(self) -> None:
+        """Periodically flush queued pytest lines while a run is active."""
+        self._flush_output_queue()
+        if self.run_in_progress:
+            self._drain_job = self.after(DRAIN_INTERVAL_MS, self._drain_queue)
+
+    def _flush_output_queue(self) -> None:
+        """Insert up to DRAIN_MAX_LINES queued pytest lines in one call."""
+        lines: list[str] = []
+        try:
+            while len(lines) < DRAIN_MAX_LINES:
+                lines.append(self._output_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if lines:
+            self.output_text.insert(tk.END, "".join(lines))
+            self._trim_output()
+            self.output_text.see(tk.END)
 
-        self.last_stdout = stdout
-        self.last_stderr = stderr
+    def _trim_output(self) -> None:
+        """Drop the oldest feed lines so the widget stays under FEED_MAX_LINES."""
+        line_count = int(self.output_text.index("end-1c").split(".")[0])
+        if line_count > FEED_MAX_LINES:
+            self.output_text.delete(
+                "1.0",
+                f"{line_count - FEED_MAX_LINES + 1}.0",
+            )
 
-        if stdout:
-            self.output_text.insert(tk.END, "=== PYTEST OUTPUT ===\n")
-            self.output_text.insert(tk.END, stdout + "\n")
+    def _on_pytest_done(self, event: tk.Event) -> None:  # type: ignore[type-arg]
+        """Summarize the finished pytest run and record it in history."""
+        if self._drain_job is not None:
+            self.after_cancel(self._drain_job)
+            self._drain_job = None
 
-        if stderr:
-            self.output_text.insert(tk.END, "=== PYTEST ERRORS ===\n")
-            self.output_text.insert(tk.END, stderr + "\n")
+        # Every line was queued before the worker posted <<PytestDone>>
+        while not self._output_queue.empty():
+            self._flush_output_queue()
 
-        combined = (stdout or "") + "\n" + (stderr or "")
-        self._parse_test_summary(combined)
+        assert self._pytest_result is not None
+        stdout, stderr, return_code, counts = self._pytest_result
+        flag = self._pending_flag
 
-        self.output_text.insert(
-            tk.END,
-            f"\n[EXIT CODE] {return_code}\n",
-        )
+        self.last_stdout = stdout
+        self.last_stderr = stderr
+
+        parts = []
+        if stderr:
+            parts.append("=== PYTEST ERRORS ===\n")
+            parts.append(stderr + "\n")
+        parts.append(f"\n[EXIT CODE] {return_code}\n")
+        footer = "".join(parts)
+        self.output_text.insert(tk.END, footer)
+        self._trim_output()
         self.output_text.see(tk.END)
 
-        # Take snapshot of full terminal output for history
-        full_output = self.output_text.get("1.0", tk.END)
-        self._add_run_to_history(return_code, flag, full_output)
+        if counts is not None:
+            self._apply_test_counts(counts)
+        else:
+            # pytest prints its summary on stdout; stderr only holds runner errors
+            self._parse_test_summary(stdout or "")
+
+        # Unlock first: a disabled Listbox ignores the history insert
+        self.run_in_progress = False
+        self._set_run_controls(enabled=True)
+
+        # Build the full feed text only to compress it into history
+        target_path, is_directory = self._run_target
+        self._feed_entry = self._add_run_to_history(
+            return_code,
+            flag,
+            self._run_header + stdout + footer,
+            target_path,
+            is_directory,
+        )
 
         if self.tests_failed > 0 or self.tests_errors > 0 or return_code != 0:
             self.cursor_label.config(text="> RUN COMPLETE (ISSUES) _")
         else:
             self.cursor_label.config(text="> RUN COMPLETE (OK) _")
 
+    def _set_run_controls(self, enabled: bool) -> None:
+        """Lock or unlock every control that would disturb a running pytest."""
+        state: Literal["normal", "disabled"] = "normal" if enabled else "disabled"
+        self.select_button.config(state=state, bg=NEON_PINK if enabled else "#333333")
+        if enabled and self.selected_path:
+            self.run_button.config(state=tk.NORMAL, bg=NEON_PINK)
+        else:
+            self.run_button.config(state=tk.DISABLED, bg="#555555")
+        # Exports would only see a half-written feed mid-run
+        for button in (self.save_txt_button, self.save_html_button):
+            button.config(state=state, bg=NEON_PINK if enabled else "#555555")
+        self.file_radio.config(state=state)
+        self.folder_radio.config(state=state)
+        self.history_listbox.config(state=state)
+
+    def _feed_text(self) -> str:
+        """Full text of the output on screen, not the FEED_MAX_LINES tail."""
+        assert self._feed_entry is not None
+        return zlib.decompress(self._feed_entry["output_zbytes"]).decode("utf-8")
+
     def _ensure_output_exists(self) -> bool:
         """Check if there is output to save."""
-        content = self.output_text.get("1.0", tk.END).strip()
-        if not content:
+        if self._feed_entry is None:
             messagebox.showinfo(
                 "No output",
                 "No terminal feed yet. Run pytest first.",
@@ -887,7 +1248,7 @@ class PytestGUI(tk.Tk):
         if not file_path:
             return
 
-        content = self.output_text.get("1.0", tk.END)
+        content = self._feed_text()
         try:
             with open(file_path, "w", encoding="utf-8") as file:
                 file.write(content)
@@ -899,7 +1260,7 @@ class PytestGUI(tk.Tk):
         """
         Save current output to a simple HTML file.
 
-        The output is wrapped in <pre> tags so formatting is preserved.
+        The output is escaped and wrapped in <pre> tags so formatting is preserved.
         """
         if not self._ensure_output_exists():
             return
@@ -912,30 +1273,14 @@ class PytestGUI(tk.Tk):
         if not file_path:
             return
 
-        content = self.output_text.get("1.0", tk.END)
-        html = (
-            "<!DOCTYPE html>\n"
-            "<html>\n<head>\n"
-            "<meta charset='utf-8'>\n"
-            "<title>pytest output</title>\n"
-            "<style>\n"
-            "body { background:#050814; color:#f5f5f5; "
-            "font-family:Consolas,monospace; }\n"
-            "h2 { color:#00f5ff; }\n"
-            "pre { background:#0b1020; padding:1rem; border:1px solid #3dffb8; "
-            "color:#e0e0ff; white-space:pre-wrap; }\n"
-            "</style>\n"
-            "</head>\n<body>\n"
-            "<h2>CYBERTEST // pytest output</h2>\n"
-            "<pre>\n"
-            f"{content}\n"
-            "</pre>\n"
-            "</body>\n</html>\n"
-        )
+        content = self._feed_text()
 
         try:
+            # Write in pieces so the output is never copied into one big string
             with open(file_path, "w", encoding="utf-8") as file:
-                file.write(html)
+                file.write(HTML_HEADER)
+                file.write(html.escape(content, quote=False))
+                file.write(HTML_FOOTER)
             messagebox.showinfo("Saved", f"HTML output saved to:\n{file_path}")
         except OSError as exc:
             messagebox.showerror("Error", f"Could not save file:\n{exc}")